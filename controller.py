@@ -3,15 +3,18 @@ Controller layer for Zettelkasten GUI.
 Handles business logic, no Tkinter dependencies.
 """
 
+import asyncio
+import copy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+from src.core import Note
 from src.core.processor import ZettelkastenProcessor
 from src.config.manager import ConfigManager
 from src.events import EventDispatcher, EventType, Event
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessingResult:
     """Result of processing XML content."""
     success: bool
@@ -29,10 +32,14 @@ class ZettelkastenController:
 
     def __init__(self, event_dispatcher: EventDispatcher = None):
         self.event_dispatcher = event_dispatcher or EventDispatcher()
+        self._config_cache: Dict[str, str] = ConfigManager.load()
+        # Last successfully parsed input and its notes (preview -> save reuse)
+        self._parsed: Optional[Tuple[str, List[Note]]] = None
 
     def load_config(self) -> dict:
         """Load saved configuration from config manager."""
-        return ConfigManager.load()
+        self._config_cache = ConfigManager.load()
+        return dict(self._config_cache)
 
     def save_config(
         self,
@@ -41,13 +48,30 @@ class ZettelkastenController:
         chapter: str = "",
         output_dir: str = ""
     ) -> None:
-        """Save configuration to config manager."""
-        ConfigManager.save(
+        """Save configuration to config manager (skipped if nothing changed)."""
+        updates = {
+            key: value
+            for key, value in (
+                ("author", author),
+                ("reference", reference),
+                ("chapter", chapter),
+                ("output_dir", output_dir),
+            )
+            if value
+        }
+        if all(self._config_cache.get(key) == value for key, value in updates.items()):
+            return
+
+        saved = ConfigManager.save(
             author=author,
             reference=reference,
             chapter=chapter,
             output_dir=output_dir
         )
+        # Only a successful write may mark these values as saved, or a
+        # failed one would suppress every retry for the rest of the session
+        if saved:
+            self._config_cache.update(updates)
 
     def process_xml(
         self,
@@ -79,11 +103,117 @@ class ZettelkastenController:
                 error="Empty input"
             )
 
+        return self._process(
+            lambda: self._parse_cached(xml_content),
+            author=author,
+            reference=reference,
+            chapter=chapter,
+            output_dir=output_dir,
+            split_notes=split_notes
+        )
+
+    async def aprocess_xml(
+        self,
+        xml_content: str,
+        author: str = "",
+        reference: str = "",
+        chapter: str = "",
+        output_dir: Optional[Path] = None,
+        split_notes: bool = False
+    ) -> ProcessingResult:
+        """
+        Awaitable process_xml(), run in the event loop's default executor.
+
+        Takes the same arguments and returns the same result as process_xml().
+        """
+        return await asyncio.to_thread(
+            self.process_xml,
+            xml_content=xml_content,
+            author=author,
+            reference=reference,
+            chapter=chapter,
+            output_dir=output_dir,
+            split_notes=split_notes
+        )
+
+    def process_xml_stream(
+        self,
+        xml_source: Union[str, Path, BinaryIO],
+        author: str = "",
+        reference: str = "",
+        chapter: str = "",
+        output_dir: Optional[Path] = None,
+        split_notes: bool = False
+    ) -> ProcessingResult:
+        """
+        Process XML from a file or binary stream without loading it whole.
+
+        Args:
+            xml_source: Path to an XML file, or a binary file-like object
+            author: Optional author name
+            reference: Optional reference source
+            chapter: Optional chapter information
+            output_dir: Directory for output (default: current directory)
+            split_notes: If True, save each note as separate file
+
+        Returns:
+            ProcessingResult with success status and paths
+        """
+        if isinstance(xml_source, (str, Path)):
+            try:
+                stream = open(xml_source, "rb", buffering=1 << 16)
+            except OSError as e:
+                self.event_dispatcher.dispatch_error(str(e))
+                return ProcessingResult(
+                    success=False,
+                    message=f"Cannot read {xml_source}: {e}",
+                    error=str(e)
+                )
+            with stream:
+                return self.process_xml_stream(
+                    stream,
+                    author=author,
+                    reference=reference,
+                    chapter=chapter,
+                    output_dir=output_dir,
+                    split_notes=split_notes
+                )
+
+        processor = ZettelkastenProcessor()
+        return self._process(
+            lambda: processor.parse_stream(xml_source),
+            author=author,
+            reference=reference,
+            chapter=chapter,
+            output_dir=output_dir,
+            split_notes=split_notes
+        )
+
+    def _parse_cached(self, xml_content: str) -> ZettelkastenProcessor:
+        """Parse XML, reusing the notes from the last call with the same input."""
+        if self._parsed is None or self._parsed[0] != xml_content:
+            notes = ZettelkastenProcessor(xml_content).parse().notes
+            self._parsed = (xml_content, notes)
+
+        # Hand out copies so metadata applied for one call doesn't leak into the next
+        return ZettelkastenProcessor.from_notes(
+            [copy.copy(note) for note in self._parsed[1]]
+        )
+
+    def _process(
+        self,
+        parse: Callable[[], ZettelkastenProcessor],
+        author: str,
+        reference: str,
+        chapter: str,
+        output_dir: Optional[Path],
+        split_notes: bool
+    ) -> ProcessingResult:
+        """Run a parse step, apply metadata and save the resulting notes."""
         self.event_dispatcher.dispatch_status("Parsing XML...")
 
         try:
-            processor = ZettelkastenProcessor(xml_content)
-            processor.parse()
+            processor = parse()
 
             # Apply metadata to all notes
             if author or reference or chapter:
@@ -143,12 +273,18 @@ class ZettelkastenController:
                 error=str(e)
             )
 
-    def get_output_preview(self, xml_content: str) -> str:
+    def get_output_preview(
+        self,
+        xml_content: str,
+        max_notes: Optional[int] = None
+    ) -> str:
         """
         Generate a preview of the output without saving.
 
         Args:
             xml_content: Raw XML string to parse
+            max_notes: Optional limit on the number of notes to preview;
+                parsing stops as soon as it is reached
 
         Returns:
             Formatted Markdown preview or error message
@@ -157,8 +293,10 @@ class ZettelkastenController:
             return "(No content to preview)"
 
         try:
-            processor = ZettelkastenProcessor(xml_content)
-            processor.parse()
+            if max_notes is None:
+                processor = self._parse_cached(xml_content)
+            else:
+                processor = ZettelkastenProcessor(xml_content).parse(limit=max_notes)
             return processor.format()
         except Exception as e:
             return f"Preview error: {e}"
@@ -12,15 +12,19 @@ Usage:
     python z.py input.xml --split --output my_notes/
 """
 
-import xml.etree.ElementTree as ET
-import re
 import argparse
 import sys
 import json
-from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import Optional
 from pathlib import Path
-from datetime import datetime
+
+# Core components are shared with the package; re-exported for scripts
+# that import them from this module
+from src.core import Note
+from src.core.parser import ZettelkastenParser
+from src.core.formatter import MarkdownFormatter
+from src.core.processor import ZettelkastenProcessor
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -34,10 +38,16 @@ class ConfigManager:
     
     @classmethod
     def load(cls) -> dict:
-        """Load saved configuration."""
+        """Load saved configuration (a copy, safe to modify)."""
+        return dict(cls._load_cached())
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _load_cached(cls) -> dict:
+        """Read and parse the config file once; save() clears the cache."""
         if cls.CONFIG_FILE.exists():
             try:
-                return json.loads(cls.CONFIG_FILE.read_text(encoding="utf-8"))
+                return json.loads(cls.CONFIG_FILE.read_bytes())
             except (json.JSONDecodeError, IOError):
                 pass
         return {"author": "", "reference": "", "chapter": ""}
@@ -53,6 +63,8 @@ class ConfigManager:
             )
         except IOError:
             pass  # Silently fail if we can't write config
+        finally:
+            cls._load_cached.cache_clear()
     
     @classmethod
     def get_prefilled(cls, key: str) -> str:
@@ -60,392 +72,6 @@ class ConfigManager:
         config = cls.load()
         return config.get(key, "")
 
-# ═══════════════════════════════════════════════════════════════════════════════
-#                               DATA CLASSES
-# ═══════════════════════════════════════════════════════════════════════════════
-
-@dataclass
-class Note:
-    """Represents a single Zettelkasten note."""
-    title: str
-    tags: List[str]
-    mentions: List[str]
-    connections: List[str]
-    principle: str
-    content: str
-    evidence: str
-    why_it_matters: str
-    recall_question: str
-    
-    # Metadata (not from XML, added during processing)
-    id: Optional[str] = None
-    created_at: Optional[str] = None
-    author: Optional[str] = None
-    reference: Optional[str] = None
-    chapter: Optional[str] = None
-    
-    def get_filename(self, suffix: str = ".md") -> str:
-        """Generate a safe filename from the note title."""
-        # Remove non-alphanumeric characters (except spaces and hyphens)
-        safe = re.sub(r'[^\w\s-]', '', self.title)
-        # Replace spaces and underscores with hyphens
-        safe = re.sub(r'[\s_]+', '-', safe)
-        # Convert to lowercase
-        safe = safe.lower()
-        # Limit length to avoid overly long filenames
-        safe = safe[:80].strip('-')
-        return f"{safe}{suffix}"
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-#                               XML PARSER
-# ═══════════════════════════════════════════════════════════════════════════════
-
-class ZettelkastenParser:
-    """Parses XML output from Zettelkasten prompt."""
-    
-    def __init__(self, xml_content: str):
-        self.xml_content = self._clean_xml(xml_content)
-        self.root = None
-        self.notes: List[Note] = []
-        
-    def _clean_xml(self, xml_content: str) -> str:
-        """Clean XML content of common issues."""
-        # Remove markdown code fences if present
-        xml_content = re.sub(r'^```xml?\s*\n?', '', xml_content, flags=re.MULTILINE)
-        xml_content = re.sub(r'\n?```\s*$', '', xml_content, flags=re.MULTILINE)
-        
-        # Strip leading/trailing whitespace
-        xml_content = xml_content.strip()
-        
-        return xml_content
-    
-    def parse(self) -> List[Note]:
-        """Parse the XML and return list of notes."""
-        try:
-            self.root = ET.fromstring(self.xml_content)
-        except ET.ParseError as e:
-            raise ValueError(f"Invalid XML: {e}")
-        
-        # Find notes element (may be root or nested)
-        notes_elem = self.root if self.root.tag == "notes" else self.root.find(".//notes")
-        
-        if notes_elem is None:
-            raise ValueError(f"No <notes> element found in XML")
-        
-        self.root = notes_elem
-        return self._parse_notes()
-    
-    def _parse_notes(self) -> List[Note]:
-        """Parse notes from XML."""
-        self.notes = []
-        timestamp = datetime.now().isoformat()
-        
-        for idx, note_elem in enumerate(self.root.findall("note"), start=1):
-            note = Note(
-                id=f"note_{idx:03d}",
-                created_at=timestamp,
-                title=self._get_text(note_elem, "title"),
-                tags=self._parse_pipe_list(self._get_text(note_elem, "tags")),
-                mentions=self._parse_mentions(self._get_text(note_elem, "mentions")),
-                connections=self._parse_connections(self._get_text(note_elem, "connections")),
-                principle=self._get_text(note_elem, "principle"),
-                content=self._parse_content(self._get_text(note_elem, "content")),
-                evidence=self._get_text(note_elem, "evidence"),
-                why_it_matters=self._get_text(note_elem, "why_it_matters"),
-                recall_question=self._get_text(note_elem, "recall_question"),
-            )
-            self.notes.append(note)
-        
-        return self.notes
-    
-    def _get_text(self, parent: Optional[ET.Element], tag: str) -> str:
-        """Safely get text content from a child element."""
-        if parent is None:
-            return ""
-        elem = parent.find(tag)
-        if elem is None:
-            return ""
-        return (elem.text or "").strip()
-    
-    def _parse_pipe_list(self, text: str) -> List[str]:
-        """Parse pipe-separated list into Python list."""
-        if not text or text == "[NO_MENTIONS]":
-            return []
-        return [item.strip() for item in text.split("|") if item.strip()]
-    
-    def _parse_mentions(self, text: str) -> List[str]:
-        """Parse @mentions from pipe-separated string."""
-        if not text or text == "[NO_MENTIONS]":
-            return []
-        mentions = []
-        for item in text.split("|"):
-            item = item.strip()
-            if item.startswith("@"):
-                mentions.append(item)
-            elif item:
-                mentions.append(f"@{item}")
-        return mentions
-    
-    def _parse_connections(self, text: str) -> List[str]:
-        """Parse [[connections]] from pipe-separated string."""
-        if not text:
-            return []
-        connections = []
-        # Extract content within [[ ]]
-        pattern = r'\[\[([^\]]+)\]\]'
-        matches = re.findall(pattern, text)
-        for match in matches:
-            connections.append(match.strip())
-        return connections
-    
-    def _parse_content(self, text: str) -> str:
-        """Parse content field, converting tokens to proper formatting."""
-        if not text:
-            return ""
-        # Convert [BREAK] to newlines
-        text = text.replace("[BREAK]", "\n\n")
-        # Convert [BULLET] to bullet points
-        text = text.replace("[BULLET] ", "\n• ")
-        text = text.replace("[BULLET]", "\n• ")
-        return text.strip()
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-#                            MARKDOWN FORMATTER
-# ═══════════════════════════════════════════════════════════════════════════════
-
-class MarkdownFormatter:
-    """Formats parsed data as clean Markdown."""
-    
-    @staticmethod
-    def format_notes(notes: List[Note]) -> str:
-        """Convert notes to Markdown format."""
-        lines = [
-            "# Zettelkasten Notes",
-            "",
-            f"> **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}  ",
-            f"> **Total Notes:** {len(notes)}",
-            "",
-            "---",
-            "",
-        ]
-        
-        # Table of Contents
-        lines.append("## Table of Contents")
-        lines.append("")
-        for i, note in enumerate(notes, 1):
-            anchor = MarkdownFormatter._slugify(note.title)
-            lines.append(f"{i}. [{note.title}](#{anchor})")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-        
-        # Individual notes
-        for note in notes:
-            lines.append(MarkdownFormatter._format_single_note(note))
-            lines.append("")
-        
-        return "\n".join(lines)
-    
-    @staticmethod
-    def _format_single_note(note: Note, include_title_header: bool = True) -> str:
-        """Format a single note as Markdown.
-        
-        Args:
-            note: The note to format
-            include_title_header: Whether to include the title as an H2 header
-        """
-        lines = []
-        
-        # Title as header (optional, for combined output)
-        if include_title_header:
-            lines.append(f"## {note.title}")
-            lines.append("")
-        
-        # Metadata block (YAML frontmatter style)
-        lines.append("---")
-        lines.append(f'title: "{note.title}"')
-        
-        # Author, Reference, and Chapter in frontmatter (under title, optional)
-        if note.author:
-            lines.append(f'author: "{note.author}"')
-        if note.reference:
-            lines.append(f'reference: "{note.reference}"')
-        if note.chapter:
-            lines.append(f'chapter: "{note.chapter}"')
-        
-        lines.append(f"created: {note.created_at}")
-        
-        # Tags in YAML list format
-        if note.tags:
-            lines.append("tags:")
-            for tag in note.tags:
-                # Convert -- to / for nested tags
-                formatted_tag = tag.replace("--", "/")
-                # Replace disallowed characters with underscores: space . : ; , ? ! @ * + = ~ \ ? > < |
-                formatted_tag = re.sub(r'[\s.:;,?!@*+=~\\?<>|]', '_', formatted_tag)
-                # Ensure no consecutive underscores
-                formatted_tag = re.sub(r'_+', '_', formatted_tag)
-                # Remove leading/trailing underscores
-                formatted_tag = formatted_tag.strip('_')
-                if formatted_tag:  # Only add non-empty tags
-                    lines.append(f"  - {formatted_tag}")
-        
-        # Mentions (formatted as [[link]] without @)
-        if note.mentions:
-            lines.append("mentions:")
-            for mention in note.mentions:
-                # Remove @ prefix and format as [[link]]
-                clean_mention = mention.lstrip('@')
-                lines.append(f'  - "[[{clean_mention}]]"')
-        
-        # Connections
-        if note.connections:
-            lines.append("connections:")
-            for conn in note.connections:
-                lines.append(f'  - "[[{conn}]]"')
-        
-        lines.append("---")
-        lines.append("")
-        
-        # Principle (highlighted)
-        lines.append("### 💡 Core Principle")
-        lines.append("")
-        lines.append(f"> {note.principle}")
-        lines.append("")
-        
-        # Content
-        lines.append("### 📝 Content")
-        lines.append("")
-        lines.append(note.content)
-        lines.append("")
-        
-        # Evidence
-        lines.append("### 📚 Evidence")
-        lines.append("")
-        if note.evidence == "[NO_DIRECT_EVIDENCE]":
-            lines.append("*No direct evidence provided in source.*")
-        else:
-            lines.append(f"> {note.evidence}")
-        lines.append("")
-        
-        # Why It Matters
-        lines.append("### 🎯 Why It Matters")
-        lines.append("")
-        lines.append(note.why_it_matters)
-        lines.append("")
-        
-        # Recall Question
-        lines.append("### ❓ Recall Question")
-        lines.append("")
-        lines.append(f"**Q:** {note.recall_question}")
-        lines.append("")
-        lines.append("---")
-        
-        return "\n".join(lines)
-    
-    @staticmethod
-    def _slugify(text: str) -> str:
-        """Convert text to URL-friendly slug."""
-        slug = text.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[\s_]+', '-', slug)
-        return slug.strip('-')
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-#                               MAIN PROCESSOR
-# ═══════════════════════════════════════════════════════════════════════════════
-
-class ZettelkastenProcessor:
-    """Main processor that orchestrates parsing and formatting."""
-    
-    def __init__(self, xml_content: str):
-        self.parser = ZettelkastenParser(xml_content)
-        self.notes: List[Note] = []
-    
-    def parse(self):
-        """Parse the XML content."""
-        self.notes = self.parser.parse()
-        return self
-    
-    def format(self) -> str:
-        """Format the parsed notes as Markdown (combined output)."""
-        if not self.notes:
-            raise ValueError("No notes parsed. Call parse() first.")
-        return MarkdownFormatter.format_notes(self.notes)
-    
-    def format_single(self, note: Note) -> str:
-        """Format a single note as Markdown with frontmatter (no H2 title)."""
-        return MarkdownFormatter._format_single_note(note, include_title_header=False)
-    
-    def save(self, output_path: Path) -> Path:
-        """Save formatted output to a single file."""
-        content = self.format()
-        
-        # Ensure .md extension
-        if output_path.suffix != ".md":
-            output_path = output_path.with_suffix(".md")
-        
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content, encoding="utf-8")
-        
-        return output_path
-    
-    def save_individual(self, output_dir: Path) -> List[Path]:
-        """Save each note as an individual file.
-        
-        Args:
-            output_dir: Directory to save individual note files
-            
-        Returns:
-            List of paths to saved files
-        """
-        if not self.notes:
-            raise ValueError("No notes parsed. Call parse() first.")
-        
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        saved_paths: List[Path] = []
-        
-        for note in self.notes:
-            content = self.format_single(note)
-            filename = note.get_filename()
-            file_path = output_dir / filename
-            
-            # Handle duplicate filenames by appending a number
-            counter = 1
-            original_path = file_path
-            while file_path.exists():
-                stem = original_path.stem
-                suffix = original_path.suffix
-                file_path = output_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
-            
-            file_path.write_text(content, encoding="utf-8")
-            saved_paths.append(file_path)
-        
-        return saved_paths
-    
-    def set_author_reference_chapter(self, author: Optional[str] = None, reference: Optional[str] = None, chapter: Optional[str] = None) -> None:
-        """Set author, reference, and chapter for all notes.
-        
-        Args:
-            author: Author name (optional)
-            reference: Reference source (optional)
-            chapter: Chapter information (optional)
-        """
-        for note in self.notes:
-            if author:
-                note.author = author
-            if reference:
-                note.reference = reference
-            if chapter:
-                note.chapter = chapter
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 #                               CLI INTERFACE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -10,6 +10,8 @@ This package follows a clean architecture with:
 - config/ - Configuration management
 - gui/ - Tkinter graphical user interface
 - cli/ - Command-line interface
+
+Requires Python 3.10+ (Note is declared with @dataclass(slots=True)).
 """
 
 __version__ = "1.0.0"
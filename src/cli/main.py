@@ -13,11 +13,59 @@ Usage:
     python -m src.cli.main input.xml --author "John Doe" --reference "Book Title"
 """
 
-import argparse
+import os
 import sys
 from pathlib import Path
-from src.core.processor import ZettelkastenProcessor
-from src.config.manager import ConfigManager
+from types import SimpleNamespace
+from typing import BinaryIO, List, Optional
+
+# Bytes read from stdin per call while looking for the start of the XML
+_STDIN_CHUNK_SIZE = 1 << 16
+
+
+class _ReplayReader:
+    """Binary reader that returns already-consumed bytes before the rest of a stream."""
+    
+    def __init__(self, head: bytes, stream: BinaryIO):
+        self._head = head
+        self._stream = stream
+    
+    def read(self, size: int = -1) -> bytes:
+        """Return the replayed head first, then read from the stream."""
+        if self._head:
+            head, self._head = self._head, b""
+            return head
+        return self._stream.read(size)
+
+
+def read_file(path: Path) -> bytes:
+    """Read a whole file with raw os-level calls.
+    
+    Sized from fstat() up front, so no buffered reader or intermediate
+    buffer is created for a one-shot read.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        The file's contents
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # A single read may come back short (very large files, special files)
+        if len(data) < size or size == 0:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 1 << 16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
 
 
 def prompt_with_prefill(prompt_text: str, prefill: str = "") -> str:
@@ -49,6 +97,8 @@ def prompt_for_author_reference() -> tuple[str, str, str]:
     Returns:
         Tuple of (author, reference, chapter) - may be empty strings if not provided
     """
+    from src.config.manager import ConfigManager
+    
     # Load saved config for prefilling
     config = ConfigManager.load()
     
@@ -73,7 +123,94 @@ def prompt_for_author_reference() -> tuple[str, str, str]:
     return author, reference, chapter
 
 
-def main():
+# Short options and their long spellings, so the fast path matches one form
+_SHORT_TO_LONG = {
+    "-o": "--output",
+    "-s": "--split",
+    "-a": "--author",
+    "-r": "--reference",
+    "-c": "--chapter",
+}
+
+# Long options the fast path understands: (attribute name, takes a value)
+_FAST_OPTIONS = {
+    "--output": ("output", True),
+    "--stdout": ("stdout", False),
+    "--split": ("split", False),
+    "--author": ("author", True),
+    "--reference": ("reference", True),
+    "--chapter": ("chapter", True),
+    "--no-prompt": ("no_prompt", False),
+}
+
+
+def _tokenize_argv(argv: List[str]) -> List[str]:
+    """Normalize argv to long option names, splitting --option=value pairs."""
+    tokens = []
+    for arg in argv:
+        option, sep, value = arg.partition("=")
+        if sep and option.startswith("--") and _FAST_OPTIONS.get(option, (None, False))[1]:
+            tokens.append(option)
+            tokens.append(value)
+        else:
+            tokens.append(_SHORT_TO_LONG.get(arg, arg))
+    return tokens
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common invocations without argparse.
+    
+    Handles at most one input file plus the options above in their exact
+    spellings; anything else (--help, abbreviations, unknown or malformed
+    options) returns None so argparse can handle or report it.
+    
+    Args:
+        argv: Command-line arguments, without the program name
+        
+    Returns:
+        Namespace shaped like argparse's, or None to take the full parser
+    """
+    args = SimpleNamespace(
+        input_file=None,
+        output=None,
+        stdout=False,
+        split=False,
+        author=None,
+        reference=None,
+        chapter=None,
+        no_prompt=False,
+    )
+    tokens = iter(_tokenize_argv(argv))
+    for token in tokens:
+        if token in _FAST_OPTIONS:
+            name, takes_value = _FAST_OPTIONS[token]
+            if not takes_value:
+                setattr(args, name, True)
+                continue
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+            setattr(args, name, Path(value) if name == "output" else value)
+        elif token.startswith("-") or args.input_file is not None:
+            return None
+        else:
+            args.input_file = Path(token)
+    
+    return args
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command-line arguments, skipping argparse when possible."""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = _fast_parse_args(argv)
+    if args is not None:
+        return args
+    
+    # Only help and unusual spellings pay for importing argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Parse Zettelkasten XML output and convert to Markdown format.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -137,17 +274,42 @@ Examples:
         help="Skip interactive prompts (use with --author/--reference/--chapter or for batch processing)"
     )
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    
+    # Imported after argument parsing so --help and usage errors stay cheap
+    from src.core.processor import ZettelkastenProcessor
     
     # Get XML content
+    xml_stream = None
     if args.input_file:
-        if not args.input_file.exists():
+        if not os.path.exists(args.input_file):
             print(f"Error: File not found: {args.input_file}", file=sys.stderr)
             sys.exit(1)
-        xml_content = args.input_file.read_text(encoding="utf-8")
+        # Raw bytes go straight to the XML parser, skipping a decode pass
+        xml_content = read_file(args.input_file)
+    elif sys.stdin.isatty():
+        # Typed input is small, and stdin is needed again for the prompts
+        xml_content = sys.stdin.buffer.read()
     else:
-        # Read from stdin
-        xml_content = sys.stdin.read()
+        # Piped input is parsed as it arrives. Only the head is read up
+        # front: enough to reject empty input and spot a Markdown fence
+        stdin = sys.stdin.buffer
+        xml_content = b""
+        while not xml_content.strip():
+            chunk = stdin.read(_STDIN_CHUNK_SIZE)
+            if not chunk:
+                break
+            xml_content += chunk
+        
+        if b"```" in xml_content:
+            # Fenced pastes need _clean_xml(), which works on the whole input
+            xml_content += stdin.read()
+        elif xml_content.strip():
+            xml_stream = _ReplayReader(xml_content.lstrip(), stdin)
     
     if not xml_content.strip():
         print("Error: No XML content provided", file=sys.stderr)
@@ -173,15 +335,25 @@ Examples:
     
     # Process
     try:
-        processor = ZettelkastenProcessor(xml_content)
-        processor.parse()
+        if xml_stream is not None:
+            processor = ZettelkastenProcessor()
+            processor.parse_stream(xml_stream)
+        else:
+            processor = ZettelkastenProcessor(xml_content)
+            processor.parse()
         
         # Apply author/reference/chapter to all notes if provided
         if author or reference or chapter:
             processor.set_author_reference_chapter(author, reference, chapter)
         
         if args.stdout:
-            print(processor.format())
+            # Hand the whole document to the binary layer in one write
+            # instead of pushing it through the text wrapper
+            sys.stdout.flush()
+            out = sys.stdout.buffer
+            out.write(processor.format().encode("utf-8"))
+            out.write(b"\n")
+            out.flush()
         elif args.split:
             # Split into individual files
             if args.output:
@@ -5,11 +5,32 @@ Configuration Manager
 Manages saved configuration for Author, Reference, Chapter, and Output Directory.
 """
 
-import json
+import os
 from pathlib import Path
 from typing import Dict, Optional
 
 
+def _dumps(config: Dict[str, str]) -> bytes:
+    """Serialize config as UTF-8 key=value lines.
+    
+    Values are single-line entries; any line breaks become spaces.
+    """
+    return "".join(
+        f"{key}={' '.join(str(value).splitlines())}\n"
+        for key, value in config.items()
+    ).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict[str, str]:
+    """Parse key=value lines, ignoring lines without an '='."""
+    config = {}
+    for line in data.decode("utf-8").splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            config[key.strip()] = value
+    return config
+
+
 class ConfigManager:
     """Manages saved configuration for Zettelkasten processor."""
     
@@ -20,34 +41,67 @@ class ConfigManager:
         "output_dir": ""
     }
     
+    # Parsed configuration, read once per process and kept current by save()
+    _cache: Optional[Dict[str, str]] = None
+    
     @classmethod
     def get_config_file(cls) -> Path:
         """Get the configuration file path (local to the script)."""
+        return Path(__file__).parent.parent.parent / "zettelkasten_config.cfg"
+    
+    @classmethod
+    def get_legacy_config_file(cls) -> Path:
+        """Get the path of the JSON config written by earlier versions."""
         return Path(__file__).parent.parent.parent / "zettelkasten_config.json"
     
+    @classmethod
+    def _load_legacy(cls) -> Dict[str, str]:
+        """Read settings from the legacy JSON config, if there is one."""
+        legacy_file = cls.get_legacy_config_file()
+        if not legacy_file.exists():
+            return {}
+        
+        import json  # Only needed once, to carry old settings over
+        try:
+            saved = json.loads(legacy_file.read_bytes())
+        except (ValueError, IOError):
+            return {}
+        return saved if isinstance(saved, dict) else {}
+    
     @classmethod
     def load(cls) -> Dict[str, str]:
         """Load saved configuration.
         
+        The file is read on the first call only; later calls return a copy
+        of the cached values.
+        
         Returns:
             Dictionary containing configuration values, with defaults for missing keys
         """
+        if cls._cache is not None:
+            return cls._cache.copy()
+        
         config_file = cls.get_config_file()
         config = cls.DEFAULT_CONFIG.copy()
         
         if config_file.exists():
             try:
-                saved = json.loads(config_file.read_text(encoding="utf-8"))
+                saved = _loads(config_file.read_bytes())
                 config.update(saved)
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 pass
+        else:
+            # First run after the switch from JSON; the next save()
+            # writes these settings to the new file
+            config.update(cls._load_legacy())
         
         # Ensure all required keys are present
         for key in cls.DEFAULT_CONFIG:
             if key not in config:
                 config[key] = cls.DEFAULT_CONFIG[key]
         
-        return config
+        cls._cache = config
+        return config.copy()
     
     @classmethod
     def save(
@@ -56,7 +110,7 @@ class ConfigManager:
         reference: str = "", 
         chapter: str = "", 
         output_dir: str = ""
-    ) -> None:
+    ) -> bool:
         """Save configuration to file.
         
         Args:
@@ -64,6 +118,9 @@ class ConfigManager:
             reference: Reference source
             chapter: Chapter information
             output_dir: Output directory path
+            
+        Returns:
+            True if the file was written, False if the write failed
         """
         config_file = cls.get_config_file()
         config = cls.load()
@@ -78,13 +135,22 @@ class ConfigManager:
         if output_dir:
             config["output_dir"] = output_dir
         
+        # Write to a temp file and swap it in so a failed write never
+        # leaves a truncated config behind
+        tmp_file = config_file.with_suffix(".tmp")
         try:
-            config_file.write_text(
-                json.dumps(config, indent=2),
-                encoding="utf-8"
-            )
+            tmp_file.write_bytes(_dumps(config))
+            os.replace(tmp_file, config_file)
         except IOError:
-            pass  # Silently fail if we can't write config
+            return False  # Silently fail if we can't write config
+        
+        cls._cache = config
+        return True
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached configuration so the next load() re-reads the file."""
+        cls._cache = None
     
     @classmethod
     def get_prefilled(cls, key: str) -> str:
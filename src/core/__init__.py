@@ -10,13 +10,17 @@ This module contains the core processing components:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import re
-from datetime import datetime
 from pathlib import Path
 
+_RE_FILENAME_UNSAFE = re.compile(r'[^\w\s-]')
+_RE_FILENAME_SPACE = re.compile(r'[\s_]+')
+# str.translate table deleting every ASCII character _RE_FILENAME_UNSAFE matches
+_FILENAME_DELETE = {i: None for i in range(128) if _RE_FILENAME_UNSAFE.match(chr(i))}
 
-@dataclass
+
+@dataclass(slots=True)
 class Note:
     """Represents a single Zettelkasten note."""
     title: str
@@ -36,14 +40,28 @@ class Note:
     reference: Optional[str] = None
     chapter: Optional[str] = None
     
+    # (title, safe filename stem) from the last get_filename() call
+    _filename_cache: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def get_filename(self, suffix: str = ".md") -> str:
-        """Generate a safe filename from the note title."""
-        # Remove non-alphanumeric characters (except spaces and hyphens)
-        safe = re.sub(r'[^\w\s-]', '', self.title)
+        """Generate a safe filename from the note title (cached per title)."""
+        cached = self._filename_cache
+        if cached is not None and cached[0] == self.title:
+            return f"{cached[1]}{suffix}"
+        
+        # Remove non-alphanumeric characters (except spaces and hyphens);
+        # ASCII titles take the regex-free translate path
+        if self.title.isascii():
+            safe = self.title.translate(_FILENAME_DELETE)
+        else:
+            safe = _RE_FILENAME_UNSAFE.sub('', self.title)
         # Replace spaces and underscores with hyphens
-        safe = re.sub(r'[\s_]+', '-', safe)
+        safe = _RE_FILENAME_SPACE.sub('-', safe)
         # Convert to lowercase
         safe = safe.lower()
         # Limit length to avoid overly long filenames
         safe = safe[:80].strip('-')
+        self._filename_cache = (self.title, safe)
         return f"{safe}{suffix}"
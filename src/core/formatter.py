@@ -5,44 +5,83 @@ Markdown Formatter
 Responsible for formatting Note objects into Markdown.
 """
 
+import io
 import re
-from typing import List
-from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional
 from src.core import Note
 
+# Characters not allowed in tags: space . : ; , ? ! @ * + = ~ \ ? > < |
+_RE_TAG_INVALID = re.compile(r'[\s.:;,?!@*+=~\\?<>|]')
+# str.translate table mapping every character _RE_TAG_INVALID matches to "_"
+# (no whitespace code point lies above U+3000)
+_TAG_TRANS = {i: '_' for i in range(0x3001) if _RE_TAG_INVALID.match(chr(i))}
+_RE_UNDERSCORES = re.compile(r'_+')
+_RE_SLUG_NONWORD = re.compile(r'[^\w\s-]')
+_RE_SLUG_SPACE = re.compile(r'[\s_]+')
+# str.translate table deleting every ASCII character _RE_SLUG_NONWORD matches
+_SLUG_DELETE = {i: None for i in range(128) if _RE_SLUG_NONWORD.match(chr(i))}
+
+# Constant fragments between the per-note fields, each written in one call
+_TOC_HEADER = "---\n\n## Table of Contents\n\n"
+_PRINCIPLE_HEADER = "---\n\n### 💡 Core Principle\n\n> "
+_CONTENT_HEADER = "\n\n### 📝 Content\n\n"
+_EVIDENCE_HEADER = "\n\n### 📚 Evidence\n\n"
+_NO_EVIDENCE = "*No direct evidence provided in source.*\n\n"
+_WHY_HEADER = "### 🎯 Why It Matters\n\n"
+_RECALL_HEADER = "\n\n### ❓ Recall Question\n\n**Q:** "
+_NOTE_FOOTER = "\n\n---"
+
 
 class MarkdownFormatter:
     """Formats parsed data as clean Markdown."""
     
     @staticmethod
-    def format_notes(notes: List[Note]) -> str:
-        """Convert notes to Markdown format."""
-        lines = [
-            "# Zettelkasten Notes",
-            "",
-            f"> **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}  ",
-            f"> **Total Notes:** {len(notes)}",
-            "",
-            "---",
-            "",
-        ]
+    def format_notes(notes: List[Note], generated_at: Optional[str] = None) -> str:
+        """Convert notes to Markdown format.
+        
+        Args:
+            notes: The notes to format
+            generated_at: Pre-formatted generation timestamp (default: now)
+        """
+        return "".join(MarkdownFormatter.iter_format_notes(notes, generated_at))
+    
+    @staticmethod
+    def iter_format_notes(notes: List[Note], generated_at: Optional[str] = None) -> Iterator[str]:
+        """Yield the combined Markdown document piece by piece.
         
-        # Table of Contents
-        lines.append("## Table of Contents")
-        lines.append("")
-        for i, note in enumerate(notes, 1):
-            anchor = MarkdownFormatter._slugify(note.title)
-            lines.append(f"{i}. [{note.title}](#{anchor})")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        The header and table of contents come first, then one chunk per
+        note, so callers can write the document without holding all of it.
+        
+        Args:
+            notes: The notes to format
+            generated_at: Pre-formatted generation timestamp (default: now)
+        """
+        if generated_at is None:
+            from datetime import datetime  # Deferred: only needed without a timestamp
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M')
+        
+        # Table of Contents, built in one join
+        slugify = MarkdownFormatter._slugify
+        toc = "".join([
+            f"{i}. [{note.title}](#{slugify(note.title)})\n"
+            for i, note in enumerate(notes, 1)
+        ])
+        yield (
+            f"# Zettelkasten Notes\n\n"
+            f"> **Generated:** {generated_at}  \n"
+            f"> **Total Notes:** {len(notes)}\n\n"
+            f"{_TOC_HEADER}{toc}\n---\n"
+        )
         
         # Individual notes
         for note in notes:
-            lines.append(MarkdownFormatter._format_single_note(note))
-            lines.append("")
-        
-        return "\n".join(lines)
+            buf = io.StringIO()
+            write = buf.write
+            write("\n")
+            MarkdownFormatter._write_note(write, note)
+            write("\n")
+            yield buf.getvalue()
     
     @staticmethod
     def _format_single_note(note: Note, include_title_header: bool = True) -> str:
@@ -52,99 +91,90 @@ class MarkdownFormatter:
             note: The note to format
             include_title_header: Whether to include the title as an H2 header
         """
-        lines = []
-        
+        buf = io.StringIO()
+        MarkdownFormatter._write_note(buf.write, note, include_title_header)
+        return buf.getvalue()
+    
+    @staticmethod
+    def _write_note(
+        write: Callable[[str], int],
+        note: Note,
+        include_title_header: bool = True
+    ) -> None:
+        """Write the Markdown for a single note through a write() callable."""
         # Title as header (optional, for combined output)
         if include_title_header:
-            lines.append(f"## {note.title}")
-            lines.append("")
-        
-        # Metadata block (YAML frontmatter style)
-        lines.append("---")
-        lines.append(f'title: "{note.title}"')
+            write(f"## {note.title}\n\n")
         
         # Author, Reference, and Chapter in frontmatter (under title, optional)
-        if note.author:
-            lines.append(f'author: "{note.author}"')
-        if note.reference:
-            lines.append(f'reference: "{note.reference}"')
-        if note.chapter:
-            lines.append(f'chapter: "{note.chapter}"')
+        author = f'author: "{note.author}"\n' if note.author else ""
+        reference = f'reference: "{note.reference}"\n' if note.reference else ""
+        chapter = f'chapter: "{note.chapter}"\n' if note.chapter else ""
         
-        lines.append(f"created: {note.created_at}")
+        # Metadata block (YAML frontmatter style)
+        write(
+            f'---\ntitle: "{note.title}"\n'
+            f"{author}{reference}{chapter}"
+            f"created: {note.created_at}\n"
+        )
         
-        # Tags in YAML list format
+        # Tags in YAML list format, each list block joined and written once
         if note.tags:
-            lines.append("tags:")
-            for tag in note.tags:
-                # Convert -- to / for nested tags
-                formatted_tag = tag.replace("--", "/")
-                # Replace disallowed characters with underscores: space . : ; , ? ! @ * + = ~ \ ? > < |
-                formatted_tag = re.sub(r'[\s.:;,?!@*+=~\\?<>|]', '_', formatted_tag)
-                # Ensure no consecutive underscores
-                formatted_tag = re.sub(r'_+', '_', formatted_tag)
-                # Remove leading/trailing underscores
-                formatted_tag = formatted_tag.strip('_')
-                if formatted_tag:  # Only add non-empty tags
-                    lines.append(f"  - {formatted_tag}")
-        
-        # Mentions (formatted as [[link]] without @)
+            format_tag = MarkdownFormatter._format_tag
+            write("tags:\n" + "".join([
+                f"  - {formatted_tag}\n"
+                for formatted_tag in map(format_tag, note.tags)
+                if formatted_tag  # Only add non-empty tags
+            ]))
+        
+        # Mentions (formatted as [[link]] without @ prefix)
         if note.mentions:
-            lines.append("mentions:")
-            for mention in note.mentions:
-                # Remove @ prefix and format as [[link]]
-                clean_mention = mention.lstrip('@')
-                lines.append(f'  - "[[{clean_mention}]]"')
+            write("mentions:\n" + "".join([
+                f'  - "[[{mention.lstrip("@")}]]"\n' for mention in note.mentions
+            ]))
         
         # Connections
         if note.connections:
-            lines.append("connections:")
-            for conn in note.connections:
-                lines.append(f'  - "[[{conn}]]"')
-        
-        lines.append("---")
-        lines.append("")
-        
-        # Principle (highlighted)
-        lines.append("### 💡 Core Principle")
-        lines.append("")
-        lines.append(f"> {note.principle}")
-        lines.append("")
-        
-        # Content
-        lines.append("### 📝 Content")
-        lines.append("")
-        lines.append(note.content)
-        lines.append("")
+            write("connections:\n" + "".join([
+                f'  - "[[{conn}]]"\n' for conn in note.connections
+            ]))
         
-        # Evidence
-        lines.append("### 📚 Evidence")
-        lines.append("")
         if note.evidence == "[NO_DIRECT_EVIDENCE]":
-            lines.append("*No direct evidence provided in source.*")
+            evidence = _NO_EVIDENCE
         else:
-            lines.append(f"> {note.evidence}")
-        lines.append("")
-        
-        # Why It Matters
-        lines.append("### 🎯 Why It Matters")
-        lines.append("")
-        lines.append(note.why_it_matters)
-        lines.append("")
-        
-        # Recall Question
-        lines.append("### ❓ Recall Question")
-        lines.append("")
-        lines.append(f"**Q:** {note.recall_question}")
-        lines.append("")
-        lines.append("---")
-        
-        return "\n".join(lines)
+            evidence = f"> {note.evidence}\n\n"
+        
+        # Body sections, closing the frontmatter: principle (highlighted),
+        # content, evidence, why it matters and the recall question
+        write(
+            f"{_PRINCIPLE_HEADER}{note.principle}"
+            f"{_CONTENT_HEADER}{note.content}"
+            f"{_EVIDENCE_HEADER}{evidence}"
+            f"{_WHY_HEADER}{note.why_it_matters}"
+            f"{_RECALL_HEADER}{note.recall_question}"
+            f"{_NOTE_FOOTER}"
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_tag(tag: str) -> str:
+        """Convert a raw tag into a valid frontmatter tag (cached, tags recur across notes)."""
+        # Convert -- to / for nested tags
+        formatted_tag = tag.replace("--", "/")
+        # Replace disallowed characters with underscores
+        formatted_tag = formatted_tag.translate(_TAG_TRANS)
+        # Ensure no consecutive underscores
+        formatted_tag = _RE_UNDERSCORES.sub('_', formatted_tag)
+        # Remove leading/trailing underscores
+        return formatted_tag.strip('_')
     
     @staticmethod
     def _slugify(text: str) -> str:
         """Convert text to URL-friendly slug."""
         slug = text.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[\s_]+', '-', slug)
+        if slug.isascii():
+            slug = slug.translate(_SLUG_DELETE)
+        else:
+            slug = _RE_SLUG_NONWORD.sub('', slug)
+        slug = _RE_SLUG_SPACE.sub('-', slug)
         return slug.strip('-')
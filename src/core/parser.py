@@ -5,98 +5,256 @@ Zettelkasten XML Parser
 Responsible for parsing XML content into Note objects.
 """
 
-import xml.etree.ElementTree as ET
 import re
-from typing import List
-from datetime import datetime
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from types import ModuleType
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from src.core import Note
 
+# Bytes handed to the XML parser per feed() call
+_CHUNK_SIZE = 1 << 16
+
+# Inputs at least this large go to lxml when it is installed; below it the
+# stdlib parser is as quick and avoids importing lxml at all
+_LXML_MIN_SIZE = 256 * 1024
+
+# lxml keeps comments and processing instructions as child nodes, which
+# would cut an element's .text short at the first one; drop them while
+# parsing, as the stdlib tree builder does
+_LXML_PARSER_OPTIONS = {"remove_comments": True, "remove_pis": True}
+
+# Element names; identifier-like literals are interned by CPython, so
+# comparisons against the (parser-cached) tag strings are mostly identity checks
+_NOTES_TAG = "notes"
+_NOTE_TAG = "note"
+
+# Placeholder the prompt emits for an empty list
+_NO_MENTIONS = "[NO_MENTIONS]"
+
+# Markdown code fences around pasted XML
+_RE_FENCE_OPEN = re.compile(r'^```xml?\s*\n?', re.MULTILINE)
+_RE_FENCE_CLOSE = re.compile(r'\n?```\s*$', re.MULTILINE)
+_RE_FENCE_OPEN_BYTES = re.compile(rb'^```xml?\s*\n?', re.MULTILINE)
+_RE_FENCE_CLOSE_BYTES = re.compile(rb'\n?```\s*$', re.MULTILINE)
+# Content within [[ ]]
+_RE_CONN = re.compile(r'\[\[([^\]]+)\]\]')
+# Formatting tokens in <content> and their replacements
+_CONTENT_TOKENS = {
+    "[BREAK]": "\n\n",
+    "[BULLET] ": "\n• ",
+    "[BULLET]": "\n• ",
+}
+_RE_CONTENT_TOKEN = re.compile(r'\[BREAK\]|\[BULLET\] ?')
+
+
+@lru_cache(maxsize=1)
+def _load_lxml() -> Optional[ModuleType]:
+    """Import lxml.etree on first use, or return None if it is not installed."""
+    try:
+        # libxml2-backed parser, considerably faster on large inputs
+        from lxml import etree
+    except ImportError:  # Optional dependency, fall back to the stdlib
+        return None
+    return etree
+
+
+def _select_backend(size: Optional[int]) -> Tuple[ModuleType, Tuple[type, ...]]:
+    """Pick the XML module and its syntax error types for an input size.
+    
+    Args:
+        size: Input length, or None when unknown (streams)
+    """
+    if size is None or size >= _LXML_MIN_SIZE:
+        etree = _load_lxml()
+        if etree is not None:
+            return etree, (etree.XMLSyntaxError,)
+    return ET, (ET.ParseError,)
+
 
 class ZettelkastenParser:
     """Parses XML output from Zettelkasten prompt."""
     
-    def __init__(self, xml_content: str):
+    def __init__(self, xml_content: Union[str, bytes] = ""):
         self.xml_content = self._clean_xml(xml_content)
         self.root = None
         self.notes: List[Note] = []
+        # Tags and mentions recur across notes; share one string per value
+        self._intern: Dict[str, str] = {}
         
-    def _clean_xml(self, xml_content: str) -> str:
-        """Clean XML content of common issues."""
-        # Remove markdown code fences if present
-        xml_content = re.sub(r'^```xml?\s*\n?', '', xml_content, flags=re.MULTILINE)
-        xml_content = re.sub(r'\n?```\s*$', '', xml_content, flags=re.MULTILINE)
+    def _clean_xml(self, xml_content: Union[str, bytes]) -> Union[str, bytes]:
+        """Clean XML content of common issues.
+        
+        Raw bytes (e.g. straight from a file) are cleaned without decoding,
+        leaving the XML declaration in charge of the encoding.
+        """
+        if isinstance(xml_content, bytes):
+            fence = b"```"
+            fence_open, fence_close = _RE_FENCE_OPEN_BYTES, _RE_FENCE_CLOSE_BYTES
+        else:
+            fence = "```"
+            fence_open, fence_close = _RE_FENCE_OPEN, _RE_FENCE_CLOSE
+        
+        # Remove markdown code fences if present; a plain substring check
+        # spares unfenced input (e.g. files on disk) both regex scans
+        if fence in xml_content:
+            empty = xml_content[:0]
+            xml_content = fence_open.sub(empty, xml_content)
+            xml_content = fence_close.sub(empty, xml_content)
         
         # Strip leading/trailing whitespace
         xml_content = xml_content.strip()
         
         return xml_content
     
-    def parse(self) -> List[Note]:
+    def parse(self, limit: Optional[int] = None) -> List[Note]:
         """Parse the XML and return list of notes."""
-        try:
-            self.root = ET.fromstring(self.xml_content)
-        except ET.ParseError as e:
-            raise ValueError(f"Invalid XML: {e}")
-        
-        # Find notes element (may be root or nested)
-        notes_elem = self.root if self.root.tag == "notes" else self.root.find(".//notes")
+        content = self.xml_content
+        # str is fed as str: it is already decoded, so an encoding in the
+        # XML declaration must not be applied to it a second time
+        chunks = (
+            content[i:i + _CHUNK_SIZE]
+            for i in range(0, len(content), _CHUNK_SIZE)
+        )
+        return self._parse_chunks(chunks, limit, _select_backend(len(content)))
+    
+    def parse_stream(self, source: BinaryIO, limit: Optional[int] = None) -> List[Note]:
+        """Incrementally parse notes from a binary stream.
         
-        if notes_elem is None:
-            raise ValueError(f"No <notes> element found in XML")
+        Streams are assumed to be large, so lxml is used when available.
         
-        self.root = notes_elem
-        return self._parse_notes()
+        Args:
+            source: Binary file-like object containing the XML
+            limit: Optional maximum number of notes to parse
+            
+        Returns:
+            List of parsed notes
+        """
+        return self._parse_chunks(self._read_chunks(source), limit, _select_backend(None))
+    
+    @staticmethod
+    def _read_chunks(source: BinaryIO) -> Iterator[bytes]:
+        """Read a binary stream in fixed-size chunks until EOF."""
+        while True:
+            chunk = source.read(_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    
+    @staticmethod
+    def _iter_events(
+        chunks: Iterable[Union[str, bytes]],
+        etree: ModuleType = ET
+    ) -> Iterator[Tuple[str, ET.Element]]:
+        """Feed chunks to a pull parser, yielding start/end events as they complete."""
+        options = {} if etree is ET else _LXML_PARSER_OPTIONS
+        pull_parser = etree.XMLPullParser(events=("start", "end"), **options)
+        for chunk in chunks:
+            pull_parser.feed(chunk)
+            yield from pull_parser.read_events()
+        pull_parser.close()
+        yield from pull_parser.read_events()
     
-    def _parse_notes(self) -> List[Note]:
-        """Parse notes from XML."""
+    def _parse_chunks(
+        self,
+        chunks: Iterable[Union[str, bytes]],
+        limit: Optional[int],
+        backend: Tuple[ModuleType, Tuple[type, ...]]
+    ) -> List[Note]:
+        """Build notes from XML chunks.
+        
+        Each <note> is converted as soon as its end tag is read and then
+        discarded, so memory stays proportional to one note rather than
+        to the whole document.
+        
+        Args:
+            chunks: XML text, or encoded XML from bytes input, in order
+            limit: Optional maximum number of notes to parse
+            backend: XML module and syntax error types, from _select_backend()
+        """
+        etree, xml_errors = backend
         self.notes = []
+        self.root = None
+        from datetime import datetime  # Deferred to keep import time down
         timestamp = datetime.now().isoformat()
+        stack: List[ET.Element] = []
         
-        for idx, note_elem in enumerate(self.root.findall("note"), start=1):
-            note = Note(
-                id=f"note_{idx:03d}",
-                created_at=timestamp,
-                title=self._get_text(note_elem, "title"),
-                tags=self._parse_pipe_list(self._get_text(note_elem, "tags")),
-                mentions=self._parse_mentions(self._get_text(note_elem, "mentions")),
-                connections=self._parse_connections(self._get_text(note_elem, "connections")),
-                principle=self._get_text(note_elem, "principle"),
-                content=self._parse_content(self._get_text(note_elem, "content")),
-                evidence=self._get_text(note_elem, "evidence"),
-                why_it_matters=self._get_text(note_elem, "why_it_matters"),
-                recall_question=self._get_text(note_elem, "recall_question"),
-            )
-            self.notes.append(note)
+        try:
+            for event, elem in self._iter_events(chunks, etree):
+                if event == "start":
+                    # Notes element may be the root or nested
+                    if self.root is None and elem.tag == _NOTES_TAG:
+                        self.root = elem
+                    stack.append(elem)
+                    continue
+                
+                stack.pop()
+                if elem.tag != _NOTE_TAG or not stack or stack[-1] is not self.root:
+                    continue
+                
+                self.notes.append(self._parse_note(elem, len(self.notes) + 1, timestamp))
+                # Free the subtree now that the note has been extracted
+                elem.clear()
+                self.root.remove(elem)
+                
+                if limit is not None and len(self.notes) >= limit:
+                    break
+        except xml_errors as e:
+            raise ValueError(f"Invalid XML: {e}")
+        
+        if self.root is None:
+            raise ValueError(f"No <notes> element found in XML")
         
         return self.notes
     
-    def _get_text(self, parent: Optional[ET.Element], tag: str) -> str:
-        """Safely get text content from a child element."""
-        if parent is None:
-            return ""
-        elem = parent.find(tag)
-        if elem is None:
-            return ""
-        return (elem.text or "").strip()
+    def _parse_note(self, note_elem: ET.Element, idx: int, timestamp: str) -> Note:
+        """Build a Note from a single <note> element."""
+        # Collect child texts in one pass instead of a find() per field,
+        # keeping the first occurrence of each tag as find() would
+        fields: Dict[str, str] = {}
+        for child in note_elem:
+            if child.tag not in fields:
+                fields[child.tag] = (child.text or "").strip()
+        get = fields.get
+        
+        return Note(
+            id=f"note_{idx:03d}",
+            created_at=timestamp,
+            title=get("title", ""),
+            tags=self._parse_pipe_list(get("tags", "")),
+            mentions=self._parse_mentions(get("mentions", "")),
+            connections=self._parse_connections(get("connections", "")),
+            principle=get("principle", ""),
+            content=self._parse_content(get("content", "")),
+            evidence=get("evidence", ""),
+            why_it_matters=get("why_it_matters", ""),
+            recall_question=get("recall_question", ""),
+        )
     
     def _parse_pipe_list(self, text: str) -> List[str]:
         """Parse pipe-separated list into Python list."""
-        if not text or text == "[NO_MENTIONS]":
+        if not text or text == _NO_MENTIONS:
             return []
-        return [item.strip() for item in text.split("|") if item.strip()]
+        intern = self._intern.setdefault
+        return [
+            intern(item, item)
+            for item in (part.strip() for part in text.split("|"))
+            if item
+        ]
     
     def _parse_mentions(self, text: str) -> List[str]:
         """Parse @mentions from pipe-separated string."""
-        if not text or text == "[NO_MENTIONS]":
+        if not text or text == _NO_MENTIONS:
             return []
-        mentions = []
-        for item in text.split("|"):
-            item = item.strip()
-            if item.startswith("@"):
-                mentions.append(item)
-            elif item:
-                mentions.append(f"@{item}")
-        return mentions
+        intern = self._intern.setdefault
+        return [
+            intern(mention, mention)
+            for mention in (
+                item if item.startswith("@") else "@" + item
+                for item in (part.strip() for part in text.split("|"))
+                if item
+            )
+        ]
     
     def _parse_connections(self, text: str) -> List[str]:
         """Parse [[connections]] from pipe-separated string."""
@@ -104,8 +262,7 @@ class ZettelkastenParser:
             return []
         connections = []
         # Extract content within [[ ]]
-        pattern = r'\[\[([^\]]+)\]\]'
-        matches = re.findall(pattern, text)
+        matches = _RE_CONN.findall(text)
         for match in matches:
             connections.append(match.strip())
         return connections
@@ -114,9 +271,6 @@ class ZettelkastenParser:
         """Parse content field, converting tokens to proper formatting."""
         if not text:
             return ""
-        # Convert [BREAK] to newlines
-        text = text.replace("[BREAK]", "\n\n")
-        # Convert [BULLET] to bullet points
-        text = text.replace("[BULLET] ", "\n• ")
-        text = text.replace("[BULLET]", "\n• ")
+        # Convert [BREAK] to newlines and [BULLET] to bullet points in one pass
+        text = _RE_CONTENT_TOKEN.sub(lambda m: _CONTENT_TOKENS[m.group()], text)
         return text.strip()
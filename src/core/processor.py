@@ -5,19 +5,27 @@ Zettelkasten Processor
 Main processor that orchestrates parsing and formatting with dependency injection.
 """
 
-from typing import List, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Optional, Tuple, Union
 from pathlib import Path
 from src.core.parser import ZettelkastenParser
 from src.core.formatter import MarkdownFormatter
 from src.core import Note
 
+# Flags for writing a note file in one unbuffered pass (O_BINARY is Windows-only)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Batches larger than this are written from a thread pool
+_THREAD_POOL_MIN_NOTES = 8
+
 
 class ZettelkastenProcessor:
     """Main processor that orchestrates parsing and formatting."""
     
     def __init__(
         self, 
-        xml_content: str,
+        xml_content: Union[str, bytes] = "",
         parser: ZettelkastenParser = None,
         formatter: MarkdownFormatter = None
     ):
@@ -25,51 +33,94 @@ class ZettelkastenProcessor:
         Initialize the processor with optional parser and formatter overrides.
         
         Args:
-            xml_content: XML content to process
+            xml_content: XML content to process, as text or raw bytes
             parser: Optional custom parser instance (defaults to ZettelkastenParser)
             formatter: Optional custom formatter instance (defaults to MarkdownFormatter)
         """
-        self.xml_content = xml_content
-        self.parser = parser or ZettelkastenParser(xml_content)
-        self.formatter = formatter or MarkdownFormatter()
+        # The parser owns the (cleaned) XML; only build the default one
+        # when none was injected, so an override skips _clean_xml()
+        self.parser = parser if parser is not None else ZettelkastenParser(xml_content)
+        self.formatter = formatter if formatter is not None else MarkdownFormatter()
         self.notes: List[Note] = []
+        # One timestamp per processor keeps repeated format() calls consistent
+        from datetime import datetime  # Deferred to keep import time down
+        self._generated_at = datetime.now().strftime('%Y-%m-%d %H:%M')
     
-    def parse(self):
+    @classmethod
+    def from_notes(
+        cls,
+        notes: List[Note],
+        formatter: MarkdownFormatter = None
+    ) -> "ZettelkastenProcessor":
+        """Create a processor around notes that have already been parsed.
+        
+        Args:
+            notes: Parsed notes to format or save
+            formatter: Optional custom formatter instance
+        """
+        processor = cls(formatter=formatter)
+        processor.notes = notes
+        return processor
+    
+    def parse(self, limit: Optional[int] = None):
         """Parse the XML content."""
-        self.notes = self.parser.parse()
+        self.notes = self.parser.parse(limit)
+        return self
+    
+    def parse_stream(self, source: BinaryIO, limit: Optional[int] = None):
+        """Parse XML incrementally from a binary stream instead of a string."""
+        self.notes = self.parser.parse_stream(source, limit)
         return self
     
     def format(self) -> str:
         """Format the parsed notes as Markdown (combined output)."""
         if not self.notes:
             raise ValueError("No notes parsed. Call parse() first.")
-        return self.formatter.format_notes(self.notes)
+        return self.formatter.format_notes(self.notes, generated_at=self._generated_at)
     
     def format_single(self, note: Note) -> str:
         """Format a single note as Markdown with frontmatter (no H2 title)."""
         return self.formatter._format_single_note(note, include_title_header=False)
     
     def save(self, output_path: Path) -> Path:
-        """Save formatted output to a single file."""
-        content = self.format()
+        """Save formatted output to a single file.
+        
+        The document is streamed to disk note by note rather than
+        built as one string first.
+        """
+        if not self.notes:
+            raise ValueError("No notes parsed. Call parse() first.")
+        
+        # Work on the plain string; os.path avoids a Path object per step
+        path = os.fspath(output_path)
         
         # Ensure .md extension
-        if output_path.suffix != ".md":
-            output_path = output_path.with_suffix(".md")
+        root, ext = os.path.splitext(path)
+        if ext != ".md":
+            path = root + ".md"
         
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content, encoding="utf-8")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
-        return output_path
+        chunks = self.formatter.iter_format_notes(self.notes, generated_at=self._generated_at)
+        # newline="" keeps "\n" line endings on every platform
+        with open(path, "w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+            f.writelines(chunks)
+        
+        return Path(path)
     
-    def save_individual(self, output_dir: Path) -> List[Path]:
-        """Save each note as an individual file.
+    def render_individual(self, output_dir: Path) -> List[Tuple[Path, bytes]]:
+        """Resolve a unique file path and UTF-8 content for each note.
+        
+        Nothing is written except the output directory itself, so callers
+        can decide how to perform the writes.
         
         Args:
-            output_dir: Directory to save individual note files
+            output_dir: Directory the individual note files will live in
             
         Returns:
-            List of paths to saved files
+            List of (path, encoded content) pairs in note order
         """
         if not self.notes:
             raise ValueError("No notes parsed. Call parse() first.")
@@ -77,26 +128,76 @@ class ZettelkastenProcessor:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        saved_paths: List[Path] = []
+        format_note = self.formatter._format_single_note
+        
+        rendered: List[Tuple[Path, bytes]] = []
+        # Names already on disk plus those claimed earlier in this batch;
+        # one directory listing replaces a stat() per candidate name.
+        # Compared case-folded so case-insensitive filesystems never clobber.
+        taken = {name.casefold() for name in os.listdir(output_dir)}
         
         for note in self.notes:
-            content = self.format_single(note)
             filename = note.get_filename()
-            file_path = output_dir / filename
             
             # Handle duplicate filenames by appending a number
-            counter = 1
-            original_path = file_path
-            while file_path.exists():
-                stem = original_path.stem
-                suffix = original_path.suffix
-                file_path = output_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
+            if filename.casefold() in taken:
+                stem, suffix = os.path.splitext(filename)
+                counter = 1
+                while f"{stem}_{counter}{suffix}".casefold() in taken:
+                    counter += 1
+                filename = f"{stem}_{counter}{suffix}"
             
-            file_path.write_text(content, encoding="utf-8")
-            saved_paths.append(file_path)
+            taken.add(filename.casefold())
+            content = format_note(note, include_title_header=False)
+            rendered.append((output_dir / filename, content.encode("utf-8")))
         
-        return saved_paths
+        return rendered
+    
+    def save_individual(self, output_dir: Path) -> List[Path]:
+        """Save each note as an individual file.
+        
+        Batches of more than a few notes are written from a thread pool:
+        each note is an independent file and the GIL is released during
+        the write syscalls, so slow disks and network shares overlap well.
+        
+        Args:
+            output_dir: Directory to save individual note files
+            
+        Returns:
+            List of paths to saved files
+        """
+        rendered = self.render_individual(output_dir)
+        
+        if len(rendered) > _THREAD_POOL_MIN_NOTES:
+            # I/O-bound, so oversubscribe the cores
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda item: self.write_file(*item), rendered))
+        else:
+            for file_path, data in rendered:
+                self.write_file(file_path, data)
+        
+        return [file_path for file_path, _ in rendered]
+    
+    @staticmethod
+    def write_file(file_path: Path, data: bytes) -> None:
+        """Write bytes to a file with raw os-level calls.
+        
+        Note files are small, so skipping the buffered file object saves
+        its allocation and the extra copy into its buffer.
+        
+        Args:
+            file_path: Destination file, created or truncated
+            data: Encoded file content
+        """
+        fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                # os.write may write less than asked, e.g. on full pipes or signals
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
     
     def set_author_reference_chapter(self, author: Optional[str] = None, reference: Optional[str] = None, chapter: Optional[str] = None) -> None:
         """Set author, reference, and chapter for all notes.
@@ -106,10 +207,20 @@ class ZettelkastenProcessor:
             reference: Reference source (optional)
             chapter: Chapter information (optional)
         """
+        # Decide which fields apply once, not per note
+        updates = [
+            (attr, value)
+            for attr, value in (("author", author), ("reference", reference), ("chapter", chapter))
+            if value
+        ]
+        if not updates:
+            return
+        
+        if len(updates) == 3:
+            for note in self.notes:
+                note.author, note.reference, note.chapter = author, reference, chapter
+            return
+        
         for note in self.notes:
-            if author:
-                note.author = author
-            if reference:
-                note.reference = reference
-            if chapter:
-                note.chapter = chapter
+            for attr, value in updates:
+                setattr(note, attr, value)
@@ -5,17 +5,19 @@ Event System
 A simple event system for decoupled communication between components.
 """
 
-from typing import Callable, Dict, List, Any
-from enum import Enum, auto
+import weakref
+from types import MethodType
+from typing import Callable, Dict, List, Any, Optional
+from enum import IntEnum
 
 
-class EventType(Enum):
-    """Available event types."""
-    STATUS_UPDATED = auto()
-    ERROR_OCCURRED = auto()
-    PROCESSING_STARTED = auto()
-    PROCESSING_COMPLETED = auto()
-    NOTE_SAVED = auto()
+class EventType(IntEnum):
+    """Available event types (ints, so listener lookups hash as plain ints)."""
+    STATUS_UPDATED = 1
+    ERROR_OCCURRED = 2
+    PROCESSING_STARTED = 3
+    PROCESSING_COMPLETED = 4
+    NOTE_SAVED = 5
 
 
 class Event:
@@ -26,11 +28,23 @@ class Event:
         self.data = data
 
 
+def _listener_ref(listener: Callable[[Event], None]) -> Callable[[], Optional[Callable[[Event], None]]]:
+    """Wrap a listener so that calling the wrapper returns it (or None once gone).
+    
+    Bound methods are held weakly, so registering one never keeps its owner
+    (e.g. a closed window) alive; other callables are held strongly.
+    """
+    if isinstance(listener, MethodType):
+        return weakref.WeakMethod(listener)
+    return lambda: listener
+
+
 class EventDispatcher:
     """Manages event registration and dispatch."""
     
     def __init__(self):
-        self._listeners: Dict[EventType, List[Callable[[Event], None]]] = {}
+        # Per event type, references from _listener_ref() in registration order
+        self._listeners: Dict[EventType, List[Callable[[], Optional[Callable[[Event], None]]]]] = {}
     
     def add_listener(
         self, 
@@ -46,7 +60,7 @@ class EventDispatcher:
         """
         if event_type not in self._listeners:
             self._listeners[event_type] = []
-        self._listeners[event_type].append(listener)
+        self._listeners[event_type].append(_listener_ref(listener))
     
     def remove_listener(
         self, 
@@ -61,12 +75,13 @@ class EventDispatcher:
             listener: Callback function to remove
         """
         if event_type in self._listeners:
-            try:
-                self._listeners[event_type].remove(listener)
-                if not self._listeners[event_type]:
-                    del self._listeners[event_type]
-            except ValueError:
-                pass
+            refs = self._listeners[event_type]
+            for i, ref in enumerate(refs):
+                if ref() == listener:
+                    del refs[i]
+                    break
+            if not refs:
+                del self._listeners[event_type]
     
     def dispatch(self, event: Event) -> None:
         """
@@ -75,13 +90,25 @@ class EventDispatcher:
         Args:
             event: Event object to dispatch
         """
-        if event.event_type in self._listeners:
-            for listener in self._listeners[event.event_type]:
+        refs = self._listeners.get(event.event_type)
+        if refs:
+            has_dead = False
+            for ref in refs:
+                listener = ref()
+                if listener is None:
+                    has_dead = True
+                    continue
                 try:
                     listener(event)
                 except Exception as e:
                     # Catch and log errors to prevent listener failures from breaking dispatcher
                     print(f"Error in event listener: {e}")
+            
+            # Drop listeners whose owners have been garbage collected
+            if has_dead:
+                refs[:] = [ref for ref in refs if ref() is not None]
+                if not refs:
+                    del self._listeners[event.event_type]
     
     def dispatch_status(self, message: str) -> None:
         """
@@ -0,0 +1,108 @@
+"""
+Parser Tests
+============
+
+Run with: python -m unittest discover tests
+"""
+
+import dataclasses
+import io
+import unittest
+from typing import List
+from unittest import mock
+
+from src.core import Note
+from src.core import parser as parser_module
+from src.core.parser import ZettelkastenParser
+
+# Comments and processing instructions inside fields, plus every field kind
+_MIXED_XML = (
+    "<notes>"
+    "<note><title>A<!--x-->B</title><tags>t1|<!--y-->t2</tags>"
+    "<mentions>@a|b</mentions><connections>[[C]] | [[D]]</connections>"
+    "<principle>P<?pi z?>Q</principle>"
+    "<content>one[BREAK]two<!--c-->[BULLET] three</content>"
+    "<evidence>[NO_DIRECT_EVIDENCE]</evidence>"
+    "<why_it_matters>W</why_it_matters><recall_question>R?</recall_question></note>"
+    "<!--between notes--><?pi between?>"
+    "<note><title>Second</title></note>"
+    "</notes>"
+)
+
+
+def _xml(encoding: str) -> str:
+    """One-note document whose declaration names the given encoding."""
+    return (
+        f'<?xml version="1.0" encoding="{encoding}"?>\n'
+        "<notes><note><title>Café</title><tags>a|b</tags></note></notes>"
+    )
+
+
+def _comparable(notes: List[Note]) -> List[dict]:
+    """Note fields minus the parse timestamp, for comparing two parses."""
+    return [
+        {k: v for k, v in dataclasses.asdict(note).items() if k != "created_at"}
+        for note in notes
+    ]
+
+
+def _parse_with(content: str, backend) -> List[Note]:
+    """Parse content with an explicit (etree, errors) backend."""
+    parser = ZettelkastenParser()
+    chunks = [content.encode("utf-8")]
+    return parser._parse_chunks(chunks, None, backend)
+
+
+@unittest.skipIf(parser_module._load_lxml() is None, "lxml is not installed")
+class BackendParityTest(unittest.TestCase):
+    """The stdlib and lxml backends must build the same notes."""
+
+    def test_comments_and_pis_inside_fields(self):
+        lxml_etree = parser_module._load_lxml()
+        stdlib = _parse_with(_MIXED_XML, (parser_module.ET, (parser_module.ET.ParseError,)))
+        lxml = _parse_with(_MIXED_XML, (lxml_etree, (lxml_etree.XMLSyntaxError,)))
+        self.assertEqual(stdlib[0].title, "AB")
+        self.assertEqual(stdlib[0].principle, "PQ")
+        self.assertEqual(_comparable(lxml), _comparable(stdlib))
+
+
+class SizeSwitchParityTest(unittest.TestCase):
+    """Notes must not depend on which side of _LXML_MIN_SIZE the input falls."""
+
+    def test_small_and_unknown_size_backends_agree(self):
+        small = _parse_with(_MIXED_XML, parser_module._select_backend(0))
+        unknown = _parse_with(_MIXED_XML, parser_module._select_backend(None))
+        self.assertEqual(_comparable(unknown), _comparable(small))
+
+    def test_parse_and_parse_stream_agree(self):
+        parsed = ZettelkastenParser(_MIXED_XML).parse()
+        streamed = ZettelkastenParser().parse_stream(io.BytesIO(_MIXED_XML.encode("utf-8")))
+        self.assertEqual(_comparable(streamed), _comparable(parsed))
+
+
+class DeclaredEncodingOnStrTest(unittest.TestCase):
+    """str input is already decoded; the declared encoding must not apply."""
+
+    def _assert_title(self, encoding: str) -> None:
+        notes = ZettelkastenParser(_xml(encoding)).parse()
+        self.assertEqual([note.title for note in notes], ["Café"])
+
+    def test_latin1_declaration(self):
+        self._assert_title("ISO-8859-1")
+
+    def test_utf16_declaration(self):
+        self._assert_title("UTF-16")
+
+    def test_latin1_declaration_large_input_backend(self):
+        # Force the large-input backend (lxml when installed)
+        with mock.patch.object(parser_module, "_LXML_MIN_SIZE", 0):
+            self._assert_title("ISO-8859-1")
+
+    def test_bytes_follow_declaration(self):
+        content = _xml("ISO-8859-1").encode("iso-8859-1")
+        notes = ZettelkastenParser(content).parse()
+        self.assertEqual([note.title for note in notes], ["Café"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,13 +4,25 @@ Tkinter widgets and layout, delegates all logic to controller.
 Uses event system for communication.
 """
 
+import asyncio
+import contextlib
+import os
+import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Iterator, List, Optional
 from controller import ZettelkastenController, ProcessingResult
 from src.events import EventType, Event
 
+# Characters inserted into the preview per Tk event-loop turn
+_PREVIEW_CHUNK_CHARS = 1 << 16
+
+# Status bar messages
+_MSG_PROCESSING = "Processing..."
+_MSG_READY = "Ready"
+
 
 class LabeledEntry(ttk.Frame):
     """Single-purpose widget: label + entry pair."""
@@ -25,19 +37,20 @@ class LabeledEntry(ttk.Frame):
         super().__init__(parent, **kwargs)
 
         self.label = ttk.Label(self, text=label_text, width=12, anchor="w")
-        self.label.pack(side=tk.LEFT)
+        self.label.grid(row=0, column=0, sticky="w")
 
-        self.entry = ttk.Entry(self, width=width)
-        self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        self.var = tk.StringVar(self)
+        self.entry = ttk.Entry(self, width=width, textvariable=self.var)
+        self.entry.grid(row=0, column=1, sticky="ew", padx=(5, 0))
+        self.columnconfigure(1, weight=1)
 
     def get_value(self) -> str:
-        """Get current entry value."""
-        return self.entry.get().strip()
+        """Get current entry value (unstripped)."""
+        return self.var.get()
 
     def set_value(self, value: str) -> None:
         """Set entry value."""
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, value)
+        self.var.set(value)
 
     def bind_return(self, callback) -> None:
         """Bind Return key to callback."""
@@ -57,10 +70,12 @@ class DirectorySelector(ttk.Frame):
         super().__init__(parent, **kwargs)
 
         self.label = ttk.Label(self, text=label_text, width=12, anchor="w")
-        self.label.pack(side=tk.LEFT)
+        self.label.grid(row=0, column=0, sticky="w")
 
-        self.entry = ttk.Entry(self, width=width)
-        self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        self.var = tk.StringVar(self)
+        self.entry = ttk.Entry(self, width=width, textvariable=self.var)
+        self.entry.grid(row=0, column=1, sticky="ew", padx=(5, 0))
+        self.columnconfigure(1, weight=1)
 
         self.browse_btn = ttk.Button(
             self,
@@ -68,12 +83,18 @@ class DirectorySelector(ttk.Frame):
             command=self._browse_directory,
             width=10
         )
-        self.browse_btn.pack(side=tk.LEFT, padx=(5, 0))
+        self.browse_btn.grid(row=0, column=2, padx=(5, 0))
+
+        # Last directory picked in the dialog, known to exist without a stat
+        self._last_good_dir: Optional[str] = None
 
     def _browse_directory(self) -> None:
         """Open directory browser dialog."""
-        current = self.entry.get().strip()
-        initial_dir = current if current and Path(current).exists() else str(Path.home())
+        current = self.var.get().strip()
+        if current and (current == self._last_good_dir or os.path.isdir(current)):
+            initial_dir = current
+        else:
+            initial_dir = self._last_good_dir or str(Path.home())
 
         selected = filedialog.askdirectory(
             title="Select Output Directory",
@@ -81,17 +102,16 @@ class DirectorySelector(ttk.Frame):
             mustexist=True
         )
         if selected:
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, selected)
+            self.var.set(selected)
+            self._last_good_dir = selected
 
     def get_value(self) -> str:
-        """Get current directory path."""
-        return self.entry.get().strip()
+        """Get current directory path (unstripped)."""
+        return self.var.get()
 
     def set_value(self, value: str) -> None:
         """Set directory path."""
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, value)
+        self.var.set(value)
 
 
 class ZettelkastenView:
@@ -101,6 +121,10 @@ class ZettelkastenView:
     Uses event system for communication.
     """
 
+    # One ttk.Style shared by every view on the same Tk interpreter,
+    # built on first use and rebuilt when a new interpreter asks for it
+    _style: ClassVar[Optional[ttk.Style]] = None
+
     def __init__(self, root: tk.Tk, controller: ZettelkastenController):
         self.root = root
         self.controller = controller
@@ -109,30 +133,100 @@ class ZettelkastenView:
         self.root.geometry("700x600")
         self.root.minsize(600, 400)
 
+        # Processing runs here so the Tk main loop never blocks on it
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Coroutines from the controller run on an asyncio loop in its own
+        # thread; its blocking work shares the executor, so jobs stay serial
+        self._aio_loop = asyncio.new_event_loop()
+        self._aio_loop.set_default_executor(self._executor)
+        self._aio_thread = threading.Thread(target=self._aio_loop.run_forever, daemon=True)
+        self._aio_thread.start()
+
+        # Debounced progress message and its pending after() timer
+        self._pending_status: Optional[str] = None
+        self._status_after_id: Optional[str] = None
+        # Nesting depth of batched_ui(); progress messages wait while > 0
+        self._suppress_depth = 0
+        # batched_ui() held open for the duration of a background Process run
+        self._process_ui: Optional[contextlib.ExitStack] = None
+
+        # Results awaiting the banner, shown together once the timer fires
+        self._result_batch: List[ProcessingResult] = []
+        self._batch_timer: Optional[str] = None
+        # Pending after() timer that clears the result banner
+        self._banner_after_id: Optional[str] = None
+
+        # Text of the XML input as last read; dropped on every edit
+        self._xml_cache: Optional[str] = None
+
+        # Preview window, built on first use and then reused
+        self._preview_window: Optional[tk.Toplevel] = None
+        self._preview_text: Optional[tk.Text] = None
+        # Bumped per preview so a stale chunked insert stops early
+        self._preview_generation = 0
+
+        # Bound handlers, created once so add and remove see the same objects
+        self._h_status = self._on_status_updated
+        self._h_error = self._on_error_occurred
+        self._h_started = self._on_processing_started
+        self._h_completed = self._on_processing_completed
+
         # Set up event listeners
         self._setup_event_listeners()
 
+        # Build and fill the widgets while hidden, then lay out and show
+        # the window once instead of after every grid/pack call
+        self.root.withdraw()
         self._create_widgets()
         self._load_saved_config()
+        self.root.update_idletasks()
+        self.root.deiconify()
+
+        self.root.protocol("WM_DELETE_WINDOW", self._shutdown)
+
+    @classmethod
+    def _get_style(cls, master: tk.Misc) -> ttk.Style:
+        """Return the shared ttk.Style, creating it and the banner styles once.
+
+        Styles live in a Tcl interpreter, so the cached one is only reused
+        for widgets of the interpreter it was created in.
+        """
+        if cls._style is None or cls._style.tk is not master.tk:
+            style = ttk.Style(master)
+            style.configure("Success.TLabel", foreground="green")
+            style.configure("Error.TLabel", foreground="red")
+            cls._style = style
+        return cls._style
+
+    def _event_listeners(self) -> tuple:
+        """Pairs of (event type, handler) this view listens for."""
+        return (
+            (EventType.STATUS_UPDATED, self._h_status),
+            (EventType.ERROR_OCCURRED, self._h_error),
+            (EventType.PROCESSING_STARTED, self._h_started),
+            (EventType.PROCESSING_COMPLETED, self._h_completed),
+        )
 
     def _setup_event_listeners(self) -> None:
         """Set up event listeners for controller events."""
-        self.controller.event_dispatcher.add_listener(
-            EventType.STATUS_UPDATED,
-            self._on_status_updated
-        )
-        self.controller.event_dispatcher.add_listener(
-            EventType.ERROR_OCCURRED,
-            self._on_error_occurred
-        )
-        self.controller.event_dispatcher.add_listener(
-            EventType.PROCESSING_STARTED,
-            self._on_processing_started
-        )
-        self.controller.event_dispatcher.add_listener(
-            EventType.PROCESSING_COMPLETED,
-            self._on_processing_completed
-        )
+        dispatcher = self.controller.event_dispatcher
+        for event_type, listener in self._event_listeners():
+            dispatcher.add_listener(event_type, listener)
+
+    def _shutdown(self) -> None:
+        """Detach from the controller and close the window."""
+        dispatcher = self.controller.event_dispatcher
+        for event_type, listener in self._event_listeners():
+            dispatcher.remove_listener(event_type, listener)
+        # Let a running job finish in the background; its UI callbacks
+        # are dropped once the window is gone
+        self._stop_background()
+        self.root.destroy()
+
+    def _stop_background(self) -> None:
+        """Stop the asyncio loop and release the worker thread."""
+        self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
+        self._executor.shutdown(wait=False)
 
     def _create_widgets(self) -> None:
         """Create and layout all widgets."""
@@ -173,7 +267,7 @@ class ZettelkastenView:
             text="Save each note as separate file",
             variable=self.split_var
         )
-        self.split_check.pack(side=tk.LEFT)
+        self.split_check.grid(row=0, column=0, sticky="w")
 
         # === XML Input Section ===
         input_frame = ttk.LabelFrame(main_frame, text="Paste XML Content", padding="5")
@@ -181,8 +275,17 @@ class ZettelkastenView:
         input_frame.columnconfigure(0, weight=1)
         input_frame.rowconfigure(0, weight=1)
 
-        self.xml_text = tk.Text(input_frame, wrap=tk.WORD, height=15)
+        # No undo history: it would keep a copy of every (large) paste
+        self.xml_text = tk.Text(
+            input_frame,
+            wrap=tk.WORD,
+            height=15,
+            undo=False,
+            autoseparators=False,
+            maxundo=0
+        )
         self.xml_text.grid(row=0, column=0, sticky="nsew")
+        self.xml_text.bind("<<Modified>>", self._on_text_modified)
 
         # Scrollbar for text area
         scrollbar = ttk.Scrollbar(input_frame, orient="vertical", command=self.xml_text.yview)
@@ -198,33 +301,40 @@ class ZettelkastenView:
             text="Process XML",
             command=self._on_process
         )
-        self.process_btn.pack(side=tk.LEFT, padx=(0, 5))
+        self.process_btn.grid(row=0, column=0, padx=(0, 5))
 
         self.preview_btn = ttk.Button(
             button_frame,
             text="Preview",
             command=self._on_preview
         )
-        self.preview_btn.pack(side=tk.LEFT, padx=(0, 5))
+        self.preview_btn.grid(row=0, column=1, padx=(0, 5))
 
         self.clear_btn = ttk.Button(
             button_frame,
             text="Clear",
             command=self._on_clear
         )
-        self.clear_btn.pack(side=tk.LEFT)
+        self.clear_btn.grid(row=0, column=2)
 
         # === Status Section ===
         status_frame = ttk.Frame(main_frame)
         status_frame.grid(row=4, column=0, sticky="ew")
 
+        self._status_var = tk.StringVar(self.root, value=_MSG_READY)
         self.status_label = ttk.Label(
             status_frame,
-            text="Ready",
+            textvariable=self._status_var,
             relief=tk.SUNKEN,
             anchor="w"
         )
-        self.status_label.pack(fill=tk.X)
+        self.status_label.grid(row=0, column=0, sticky="ew")
+        status_frame.columnconfigure(0, weight=1)
+
+        # === Result Banner (non-modal, clears itself) ===
+        self._get_style(self.root)
+        self.banner = ttk.Label(main_frame, text="", anchor="w")
+        self.banner.grid(row=5, column=0, sticky="ew", pady=(5, 0))
 
     def _load_saved_config(self) -> None:
         """Load and apply saved configuration."""
@@ -235,46 +345,102 @@ class ZettelkastenView:
         self.output_dir_entry.set_value(config.get("output_dir", ""))
 
     def _get_metadata(self) -> tuple[str, str, str, str]:
-        """Get current metadata values."""
+        """Get current metadata values, stripped once here."""
         return (
-            self.author_entry.get_value(),
-            self.reference_entry.get_value(),
-            self.chapter_entry.get_value(),
-            self.output_dir_entry.get_value()
+            self.author_entry.get_value().strip(),
+            self.reference_entry.get_value().strip(),
+            self.chapter_entry.get_value().strip(),
+            self.output_dir_entry.get_value().strip()
         )
 
     def _get_xml_content(self) -> str:
-        """Get XML content from text area."""
-        return self.xml_text.get("1.0", tk.END)
+        """Get XML content from text area (without Tk's trailing newline)."""
+        if self._xml_cache is None:
+            self._xml_cache = self.xml_text.get("1.0", "end-1c")
+        return self._xml_cache
+
+    def _on_text_modified(self, event: tk.Event) -> None:
+        """Drop the cached XML content when the text area changes."""
+        self._xml_cache = None
+        # Re-arm the flag so the next edit fires <<Modified>> again
+        self.xml_text.edit_modified(False)
 
     def _update_status(self, message: str) -> None:
-        """Update status bar message."""
-        self.status_label.configure(text=message)
-        self.root.update_idletasks()
+        """Update status bar message (supersedes any debounced one)."""
+        self._cancel_pending_status()
+        self._status_var.set(message)
+
+    def _cancel_pending_status(self) -> None:
+        """Drop a debounced status message that has not been shown yet."""
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+            self._status_after_id = None
+        self._pending_status = None
+
+    def _schedule_status(self, message: str) -> None:
+        """Show a progress message, coalescing bursts into one write per 30 ms."""
+        self._pending_status = message
+        if self._suppress_depth:
+            return  # Written when the outermost batched_ui() exits
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after(30, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Write the latest debounced status message to the label."""
+        self._status_after_id = None
+        if self._suppress_depth:
+            return
+        message, self._pending_status = self._pending_status, None
+        if message is not None:
+            self._status_var.set(message)
+
+    @contextlib.contextmanager
+    def batched_ui(self) -> Iterator[None]:
+        """Hold progress messages back, then show only the last one on exit.
+
+        Reentrant: nested blocks flush once, when the outermost one exits.
+        """
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+            if not self._suppress_depth and self._pending_status is not None:
+                self._flush_status()
+
+    def _call_soon(self, callback, *args) -> None:
+        """Run a callback on the Tk thread; dropped once the window is gone."""
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _post_status(self, message: str) -> None:
+        """Update the status bar from any thread (applied on the Tk thread)."""
+        self._call_soon(self._update_status, message)
 
     def _on_status_updated(self, event: Event) -> None:
-        """Handle status update events."""
-        self._update_status(event.data)
+        """Handle status update events (debounced, they can arrive in bursts)."""
+        self._call_soon(self._schedule_status, event.data)
 
     def _on_error_occurred(self, event: Event) -> None:
         """Handle error events."""
-        self._update_status(f"Error: {event.data}")
+        self._post_status(f"Error: {event.data}")
 
     def _on_processing_started(self, event: Event) -> None:
         """Handle processing started event."""
-        self._update_status("Processing...")
+        self._post_status(_MSG_PROCESSING)
 
     def _on_processing_completed(self, event: Event) -> None:
         """Handle processing completed event."""
-        self._update_status("Ready")
+        self._post_status(_MSG_READY)
 
     def _on_process(self) -> None:
         """Handle Process button click."""
         xml_content = self._get_xml_content()
-        author, reference, chapter, output_dir_str = self._get_metadata()
+        author, reference, chapter, output_dir = self._get_metadata()
 
         # Use saved output directory or prompt
-        output_dir = output_dir_str.strip()
         if not output_dir:
             output_dir = filedialog.askdirectory(
                 title="Select Output Directory",
@@ -285,67 +451,166 @@ class ZettelkastenView:
             # Save the selected directory for next time
             self.output_dir_entry.set_value(output_dir)
 
-        output_path = Path(output_dir)
-        if not output_path.exists():
+        if not os.path.isdir(output_dir):
             messagebox.showerror("Error", f"Directory does not exist: {output_dir}")
             return
+        output_path = Path(output_dir)
 
         split_notes = self.split_var.get()
 
-        result = self.controller.process_xml(
-            xml_content=xml_content,
-            author=author,
-            reference=reference,
-            chapter=chapter,
-            output_dir=output_path,
-            split_notes=split_notes
+        # Run in the background; the button stays disabled until it finishes
+        # and progress messages are held back until then too
+        self.process_btn.configure(state=tk.DISABLED)
+        self._process_ui = contextlib.ExitStack()
+        self._process_ui.enter_context(self.batched_ui())
+        future = asyncio.run_coroutine_threadsafe(
+            self.controller.aprocess_xml(
+                xml_content=xml_content,
+                author=author,
+                reference=reference,
+                chapter=chapter,
+                output_dir=output_path,
+                split_notes=split_notes
+            ),
+            self._aio_loop
+        )
+        future.add_done_callback(
+            lambda f: self._call_soon(
+                self._on_process_done, f, author, reference, chapter, str(output_path)
+            )
         )
 
+    def _on_process_done(
+        self,
+        future: Future,
+        author: str,
+        reference: str,
+        chapter: str,
+        output_dir: str
+    ) -> None:
+        """Finish a background Process run on the Tk thread."""
+        self.process_btn.configure(state=tk.NORMAL)
+        self._process_ui.close()
+        self._process_ui = None
+
         # Save config with current output directory
         self.controller.save_config(
             author=author,
             reference=reference,
             chapter=chapter,
-            output_dir=str(output_path)
+            output_dir=output_dir
         )
 
-        self._handle_result(result)
+        self._handle_result(future.result())
 
     def _on_preview(self) -> None:
         """Handle Preview button click."""
         xml_content = self._get_xml_content()
-        preview = self.controller.get_output_preview(xml_content)
 
-        # Show preview in a simple dialog
+        # Generate off the Tk thread, then render back on it
+        future = self._executor.submit(self.controller.get_output_preview, xml_content)
+        future.add_done_callback(
+            lambda f: self._call_soon(self._render_preview, f.result())
+        )
+
+    def _render_preview(self, preview: str) -> None:
+        """Show the preview dialog and start filling it in chunks."""
+        # Show preview in a simple dialog, reusing it after the first time
+        self._ensure_preview_window()
+        text_widget = self._preview_text
+        text_widget.configure(state=tk.NORMAL)
+        text_widget.delete("1.0", tk.END)
+        text_widget.configure(state=tk.DISABLED)
+
+        self._preview_window.deiconify()
+        self._preview_window.lift()
+
+        self._preview_generation += 1
+        self._insert_preview_chunk(preview, 0, self._preview_generation)
+
+    def _insert_preview_chunk(self, preview: str, start: int, generation: int) -> None:
+        """Insert one chunk of the preview, yielding to Tk between chunks."""
+        text_widget = self._preview_text
+        if generation != self._preview_generation or not text_widget.winfo_exists():
+            return
+
+        end = start + _PREVIEW_CHUNK_CHARS
+        text_widget.configure(state=tk.NORMAL)
+        text_widget.insert(tk.END, preview[start:end])
+        text_widget.configure(state=tk.DISABLED)
+
+        if end < len(preview):
+            self.root.after(0, self._insert_preview_chunk, preview, end, generation)
+
+    def _ensure_preview_window(self) -> None:
+        """Create the preview window unless it already exists."""
+        if self._preview_window is not None and self._preview_window.winfo_exists():
+            return
+
         preview_window = tk.Toplevel(self.root)
         preview_window.title("Output Preview")
         preview_window.geometry("600x500")
+        # Closing only hides the window so the next preview can reuse it
+        preview_window.protocol("WM_DELETE_WINDOW", preview_window.withdraw)
 
         text_widget = tk.Text(preview_window, wrap=tk.WORD, padx=10, pady=10)
         text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert("1.0", preview)
-        text_widget.configure(state=tk.DISABLED)
 
         scrollbar = ttk.Scrollbar(text_widget, orient="vertical", command=text_widget.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         text_widget.configure(yscrollcommand=scrollbar.set)
 
-        ttk.Button(preview_window, text="Close", command=preview_window.destroy).pack(pady=5)
+        ttk.Button(preview_window, text="Close", command=preview_window.withdraw).pack(pady=5)
+
+        self._preview_window = preview_window
+        self._preview_text = text_widget
 
     def _on_clear(self) -> None:
         """Handle Clear button click."""
         self.xml_text.delete("1.0", tk.END)
+        self._xml_cache = None
         self._update_status("Cleared")
 
     def _handle_result(self, result: ProcessingResult) -> None:
-        """Handle processing result."""
+        """Handle processing result (the banner is batched, see _flush_results)."""
         if result.success:
-            messagebox.showinfo("Success", result.message)
-            self._update_status("Ready")
+            self._update_status(_MSG_READY)
         else:
-            messagebox.showerror("Error", result.message)
             self._update_status(f"Error: {result.error}")
 
+        self._result_batch.append(result)
+        if self._batch_timer is None:
+            self._batch_timer = self.root.after(200, self._flush_results)
+
+    def _flush_results(self) -> None:
+        """Show the collected results in the banner, errors first."""
+        self._batch_timer = None
+        results, self._result_batch = self._result_batch, []
+        successes = [result for result in results if result.success]
+        errors = [result for result in results if not result.success]
+
+        lines = [result.message for result in errors]
+        if len(successes) == 1:
+            lines.append(successes[0].message)
+        elif successes:
+            written = sum(len(result.output_paths or ()) for result in successes)
+            lines.append(f"{written} files written")
+
+        self._show_banner("\n".join(lines), success=not errors)
+
+    def _show_banner(self, message: str, success: bool) -> None:
+        """Show a result in the banner and clear it again after 3 s."""
+        if self._banner_after_id is not None:
+            self.root.after_cancel(self._banner_after_id)
+        self.banner.configure(text=message, style="Success.TLabel" if success else "Error.TLabel")
+        self._banner_after_id = self.root.after(3000, self._clear_banner)
+
+    def _clear_banner(self) -> None:
+        """Empty the result banner."""
+        self._banner_after_id = None
+        self.banner.configure(text="")
+
     def run(self) -> None:
         """Start the main event loop."""
         self.root.mainloop()
+        self._stop_background()